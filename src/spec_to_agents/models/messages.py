@@ -10,13 +10,14 @@ from pydantic import BaseModel, Field
 from typing_extensions import Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class HumanFeedbackRequest:
     """
     Request for human input during event planning workflow.
 
     This dataclass is used with ctx.request_info() to pause the workflow
     and request clarification, selection, or approval from the user.
+    It uses ``__slots__`` since one is created for every request_info() call.
 
     Attributes
     ----------
@@ -12,9 +12,24 @@ from agent_framework import ai_function
 from icalendar import Calendar, Event
 from pydantic import Field
 
-# Get calendar storage path from environment
-CALENDAR_PATH: Final[Path] = Path(os.getenv("CALENDAR_STORAGE_PATH", "./data/calendars"))
-CALENDAR_PATH.mkdir(parents=True, exist_ok=True)
+# Default calendar storage path when CALENDAR_STORAGE_PATH is not set
+DEFAULT_CALENDAR_PATH: Final[str] = "./data/calendars"
+
+
+def _calendar_path() -> Path:
+    """
+    Resolve the calendar storage directory from the environment.
+
+    The path is read on every call rather than at import time, so changes to
+    ``CALENDAR_STORAGE_PATH`` (e.g. after loading a ``.env`` file) take effect
+    without reloading this module.
+
+    Returns
+    -------
+    Path
+        Directory where iCalendar (.ics) files are stored
+    """
+    return Path(os.getenv("CALENDAR_STORAGE_PATH", DEFAULT_CALENDAR_PATH))
 
 
 @ai_function  # type: ignore[arg-type]
@@ -65,7 +80,9 @@ async def create_calendar_event(  # noqa: RUF029
         end_dt = start_dt + timedelta(hours=duration_hours)
 
         # Load or create calendar
-        calendar_file = CALENDAR_PATH / f"{calendar_name}.ics"
+        calendar_path = _calendar_path()
+        calendar_path.mkdir(parents=True, exist_ok=True)
+        calendar_file = calendar_path / f"{calendar_name}.ics"
         if calendar_file.exists():
             with open(calendar_file, "rb") as f:  # noqa: ASYNC230
                 cal = Calendar.from_ical(f.read())  # type: ignore
@@ -131,7 +148,7 @@ async def list_calendar_events(  # noqa: RUF029
     Date filters are inclusive.
     """
     try:
-        calendar_file = CALENDAR_PATH / f"{calendar_name}.ics"
+        calendar_file = _calendar_path() / f"{calendar_name}.ics"
         if not calendar_file.exists():
             return f"Calendar '{calendar_name}' does not exist"
 
@@ -201,7 +218,7 @@ async def delete_calendar_event(  # noqa: RUF029
     If multiple events with the same title exist, all will be deleted.
     """
     try:
-        calendar_file = CALENDAR_PATH / f"{calendar_name}.ics"
+        calendar_file = _calendar_path() / f"{calendar_name}.ics"
         if not calendar_file.exists():
             return f"Calendar '{calendar_name}' does not exist"
 
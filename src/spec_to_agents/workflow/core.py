@@ -2,6 +2,8 @@
 
 """Event planning multi-agent workflow definition and lazy initialization."""
 
+import os
+
 from agent_framework import (
     AgentExecutor,
     BaseChatClient,
@@ -20,9 +22,29 @@ from spec_to_agents.agents import (
 from spec_to_agents.workflow.executors import EventPlanningCoordinator
 
 
+def _history_bound_from_env(name: str) -> int | None:
+    """
+    Read an optional conversation history bound from the environment.
+
+    Parameters
+    ----------
+    name : str
+        Environment variable holding the bound
+
+    Returns
+    -------
+    int | None
+        The configured bound, or None when the variable is unset or empty
+    """
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
 @inject
 def build_event_planning_workflow(
     client: BaseChatClient = Provide["client"],
+    max_history_messages: int | None = None,
+    max_history_tokens: int | None = None,
 ) -> Workflow:
     """
     Build the multi-agent event planning workflow with human-in-the-loop capabilities.
@@ -63,6 +85,16 @@ def build_event_planning_workflow(
         Connected MCP tool for coordinator's sequential thinking capabilities.
         If None, coordinator operates without MCP tool assistance.
         Must be connected (within async context manager) before passing to workflow.
+    max_history_messages : int | None, optional
+        Upper bound on the conversation forwarded between specialists. When exceeded,
+        the coordinator keeps the original request and the most recent messages and
+        omits the middle. None (default) reads ``MAX_HISTORY_MESSAGES`` from the
+        environment and forwards the full conversation when it is unset.
+    max_history_tokens : int | None, optional
+        Approximate token budget for the conversation forwarded between specialists.
+        Trims the same way as max_history_messages once the estimate is exceeded.
+        None (default) reads ``MAX_HISTORY_TOKENS`` from the environment and disables
+        the token budget when it is unset.
 
     Returns
     -------
@@ -89,7 +121,15 @@ def build_event_planning_workflow(
     catering_agent = catering_coordinator.create_agent()
     logistics_agent = logistics_manager.create_agent()
     # Create coordinator executor with routing logic
-    coordinator = EventPlanningCoordinator(coordinator_agent)
+    if max_history_messages is None:
+        max_history_messages = _history_bound_from_env("MAX_HISTORY_MESSAGES")
+    if max_history_tokens is None:
+        max_history_tokens = _history_bound_from_env("MAX_HISTORY_TOKENS")
+    coordinator = EventPlanningCoordinator(
+        coordinator_agent,
+        max_history_messages=max_history_messages,
+        max_history_tokens=max_history_tokens,
+    )
 
     # Create specialist executors
     venue_exec = AgentExecutor(agent=venue_agent, id="venue")
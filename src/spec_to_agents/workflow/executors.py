@@ -3,7 +3,10 @@
 """Custom executors for event planning workflow with human-in-the-loop."""
 
 import json
+import re
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 
 from agent_framework import (
     AgentExecutorRequest,
@@ -23,6 +26,117 @@ from pydantic import ValidationError
 
 from spec_to_agents.models.messages import HumanFeedbackRequest, SpecialistOutput
 
+# Compact JSON encoder for the standard library path. Built once: ``json.dumps`` with
+# non-default options constructs a new encoder on every call.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_json_dumps: Callable[[Any], str] = _JSON_ENCODER.encode
+
+_dumps: Callable[[Any], str]
+try:
+    import orjson
+
+    def _orjson_dumps(value: Any) -> str:
+        """
+        Serialize tool arguments/results to compact JSON using orjson (C extension).
+
+        Values orjson rejects (e.g. integers beyond 64 bits) fall back to the standard library.
+        """
+        try:
+            encoded: bytes = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return _json_dumps(value)
+        return encoded.decode()
+
+    _dumps = _orjson_dumps
+except ImportError:  # orjson is an optional speedup
+    _dumps = _json_dumps
+
+
+# Fixed instruction appended after the conversation when synthesizing the final plan
+_SYNTHESIS_PROMPT = (
+    "All specialists have completed their work. Please synthesize a comprehensive "
+    "event plan that integrates all specialist recommendations including venue "
+    "selection, budget allocation, catering options, and logistics coordination. "
+    "Provide a cohesive final plan."
+)
+
+# Marker that replaces messages omitted from a trimmed conversation. The count is parsed
+# back when a previously trimmed conversation is trimmed again, so totals stay accurate.
+_OMITTED_MARKER_TEMPLATE = "[{count} earlier messages omitted to keep the conversation within context limits]"
+_OMITTED_MARKER_PATTERN = re.compile(
+    r"^\[(\d+) earlier messages omitted to keep the conversation within context limits\]$"
+)
+
+# Rough characters-per-token ratio for English text; used to estimate context size
+# without depending on a model-specific tokenizer.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(messages: list[ChatMessage]) -> int:
+    """
+    Estimate the token count of text-only messages.
+
+    Parameters
+    ----------
+    messages : list[ChatMessage]
+        Messages whose text content should be measured
+
+    Returns
+    -------
+    int
+        Approximate number of tokens, rounded up
+
+    Notes
+    -----
+    Uses a fixed characters-per-token ratio. This is intentionally approximate: it is
+    only used to decide when the forwarded conversation should be trimmed, and tool
+    results vary far more in size than the estimation error.
+    """
+    chars = sum(len(message.text) for message in messages)
+    return -(-chars // CHARS_PER_TOKEN)
+
+
+def _format_function_call(content: FunctionCallContent) -> str:
+    """Render a function call as descriptive text."""
+    args_str = _dumps(content.arguments) if isinstance(content.arguments, dict) else str(content.arguments)
+    return f"[Tool Call: {content.name}({args_str})]"
+
+
+def _format_function_result(content: FunctionResultContent) -> str:
+    """Render a function result (or its error) as descriptive text."""
+    if content.result is not None:
+        result_str = content.result if isinstance(content.result, str) else _dumps(content.result)
+        return f"[Tool Result for call {content.call_id}: {result_str}]"
+    if content.exception is not None:
+        return f"[Tool Error for call {content.call_id}: {content.exception}]"
+    return f"[Tool Result for call {content.call_id}: No result]"
+
+
+_ToolContentFormatter = Callable[[Any], str]
+
+_BASE_TOOL_CONTENT_FORMATTERS: tuple[tuple[type, _ToolContentFormatter], ...] = (
+    (FunctionCallContent, _format_function_call),
+    (FunctionResultContent, _format_function_result),
+)
+
+# Concrete content type -> formatter (None for content kept as-is). Resolved once per
+# type so the per-content check is a single dict lookup instead of isinstance chains.
+_tool_content_formatters: dict[type, _ToolContentFormatter | None] = dict(_BASE_TOOL_CONTENT_FORMATTERS)
+
+
+def _tool_content_formatter(content_type: type) -> _ToolContentFormatter | None:
+    """Return the text formatter for a tool content type, or None for other content."""
+    try:
+        return _tool_content_formatters[content_type]
+    except KeyError:
+        # First time seeing this type: resolve subclasses of the SDK tool content types
+        formatter = next(
+            (fmt for base, fmt in _BASE_TOOL_CONTENT_FORMATTERS if issubclass(content_type, base)),
+            None,
+        )
+        _tool_content_formatters[content_type] = formatter
+        return formatter
+
 
 def convert_tool_content_to_text(messages: list[ChatMessage]) -> list[ChatMessage]:
     """
@@ -41,7 +155,8 @@ def convert_tool_content_to_text(messages: list[ChatMessage]) -> list[ChatMessag
     Returns
     -------
     list[ChatMessage]
-        New messages with tool content converted to TextContent summaries
+        Messages with tool content converted to TextContent summaries. Messages that
+        contain no tool content are returned as the original objects, not copies.
 
     Notes
     -----
@@ -50,34 +165,29 @@ def convert_tool_content_to_text(messages: list[ChatMessage]) -> list[ChatMessag
     When routing between agents in a workflow, each agent has its own thread ID, so we must
     convert tool-related content to plain text to avoid thread ID conflicts.
     """
-    converted_messages = []
+    converted_messages: list[ChatMessage] = []
+    # Bind hot lookups to locals; this loop runs over every message of every turn
+    append = converted_messages.append
+    formatter_for = _tool_content_formatter
+    text_content = TextContent
     for message in messages:
-        new_contents = []
-        for content in message.contents:
-            if isinstance(content, FunctionCallContent):
-                # Convert function call to descriptive text
-                if isinstance(content.arguments, dict):
-                    args_str = json.dumps(content.arguments)
-                else:
-                    args_str = str(content.arguments)
-                text_repr = f"[Tool Call: {content.name}({args_str})]"
-                new_contents.append(TextContent(text=text_repr))
-            elif isinstance(content, FunctionResultContent):
-                # Convert function result to descriptive text
-                if content.result is not None:
-                    result_str = content.result if isinstance(content.result, str) else json.dumps(content.result)
-                    text_repr = f"[Tool Result for call {content.call_id}: {result_str}]"
-                elif content.exception is not None:
-                    text_repr = f"[Tool Error for call {content.call_id}: {content.exception}]"
-                else:
-                    text_repr = f"[Tool Result for call {content.call_id}: No result]"
-                new_contents.append(TextContent(text=text_repr))
-            else:
-                # Keep other content types as-is (TextContent, ImageContent, etc.)
-                new_contents.append(content)
+        contents = message.contents
+        formatters = [formatter_for(type(content)) for content in contents]
+
+        # Most messages are plain text: reuse them instead of rebuilding an identical copy
+        if not any(formatters):
+            append(message)
+            continue
+
+        # Convert function calls/results to descriptive text and keep other content
+        # types as-is (TextContent, ImageContent, etc.)
+        new_contents = [
+            text_content(text=formatter(content)) if formatter is not None else content
+            for content, formatter in zip(contents, formatters, strict=True)
+        ]
 
         # Create new message with converted contents, preserving role and metadata
-        converted_messages.append(
+        append(
             ChatMessage(
                 role=message.role,
                 contents=new_contents,
@@ -116,11 +226,43 @@ class EventPlanningCoordinator(Executor):
     ----------
     coordinator_agent : ChatAgent
         The agent instance for synthesis and coordination logic
+    max_history_messages : int | None, optional
+        Upper bound on the number of messages forwarded to specialists and synthesis.
+        When exceeded, the first ``keep_first_messages`` and the most recent messages
+        are kept and the middle is replaced by a single marker message.
+        None (default) forwards the full conversation.
+    max_history_tokens : int | None, optional
+        Approximate token budget (see ``estimate_tokens``) for the forwarded conversation.
+        When exceeded, the oldest messages after the leading ones are omitted until the
+        conversation, including the omission marker, fits. Token-based trimming tracks real context usage more closely
+        than message counts, since tool results vary widely in size.
+        None (default) disables the token budget.
+    keep_first_messages : int, optional
+        Number of leading messages (date context, original request) always kept
+        when the conversation is trimmed. Default is 2.
     """
 
-    def __init__(self, coordinator_agent: ChatAgent):
+    def __init__(
+        self,
+        coordinator_agent: ChatAgent,
+        max_history_messages: int | None = None,
+        max_history_tokens: int | None = None,
+        keep_first_messages: int = 2,
+    ):
         super().__init__(id="event_coordinator")
+        if max_history_tokens is not None and max_history_tokens <= 0:
+            raise ValueError(f"max_history_tokens ({max_history_tokens}) must be positive")
+        if keep_first_messages < 0:
+            raise ValueError(f"keep_first_messages ({keep_first_messages}) must not be negative")
+        if max_history_messages is not None and max_history_messages <= keep_first_messages + 1:
+            raise ValueError(
+                f"max_history_messages ({max_history_messages}) must be greater than "
+                f"keep_first_messages + 1 ({keep_first_messages + 1})"
+            )
         self._agent = coordinator_agent
+        self._max_history_messages = max_history_messages
+        self._max_history_tokens = max_history_tokens
+        self._keep_first_messages = keep_first_messages
 
     @handler
     async def start(self, prompt: str, ctx: WorkflowContext[AgentExecutorRequest, str]) -> None:
@@ -160,6 +302,8 @@ class EventPlanningCoordinator(Executor):
         - Else: Synthesize final plan (workflow complete)
 
         Extracts full_conversation from the response to pass context to next agent.
+        Only the specialist's new messages are converted to text; the rest of the
+        conversation is the request this coordinator sent, which is already text-only.
 
         Parameters
         ----------
@@ -171,8 +315,8 @@ class EventPlanningCoordinator(Executor):
         # Parse structured output from specialist
         specialist_output = self._parse_specialist_output(response)
 
-        # Extract full conversation from specialist response
-        conversation = list(response.full_conversation or response.agent_run_response.messages)
+        # Extract full conversation from specialist response, converting only new messages
+        conversation = self._trim_conversation(self._extract_conversation(response))
 
         # Route based ONLY on structured output fields
         if specialist_output.user_input_needed:
@@ -248,7 +392,7 @@ class EventPlanningCoordinator(Executor):
         Synthesize final event plan from all specialist recommendations.
 
         This method is called after all specialists have completed their work.
-        Uses the conversation history with tool content converted to text summaries.
+        Uses the conversation history, which already has tool content converted to text summaries.
 
         Parameters
         ----------
@@ -256,22 +400,19 @@ class EventPlanningCoordinator(Executor):
             Workflow context for yielding final output
         conversation : list[ChatMessage]
             Complete conversation history including all specialist interactions.
-            Tool calls/results are converted to text summaries before synthesis.
+            Tool calls/results must already be converted to text summaries.
+
+        Notes
+        -----
+        The fixed synthesis instruction is always appended *after* the unchanged
+        conversation. Keeping the earlier messages in their original order means the
+        request shares its prefix with the specialist turns that preceded it, so the
+        model provider can reuse its cached prompt prefix. Do not insert, reorder, or
+        rewrite messages ahead of the instruction.
         """
-        # Convert tool content to text for coordinator's thread
-        clean_conversation = convert_tool_content_to_text(conversation)
-
-        # Add synthesis instruction
-        synthesis_instruction = ChatMessage(
-            Role.USER,
-            text=(
-                "All specialists have completed their work. Please synthesize a comprehensive "
-                "event plan that integrates all specialist recommendations including venue "
-                "selection, budget allocation, catering options, and logistics coordination. "
-                "Provide a cohesive final plan."
-            ),
-        )
-        clean_conversation.append(synthesis_instruction)
+        # Append the fixed synthesis instruction last to keep the prompt prefix stable
+        synthesis_instruction = ChatMessage(Role.USER, text=_SYNTHESIS_PROMPT)
+        clean_conversation = [*conversation, synthesis_instruction]
 
         # Run coordinator agent with converted conversation context
         synthesis_result = await self._agent.run(messages=clean_conversation)
@@ -280,6 +421,101 @@ class EventPlanningCoordinator(Executor):
         if synthesis_result.text:
             await ctx.yield_output(synthesis_result.text)
 
+    def _extract_conversation(self, response: AgentExecutorResponse) -> list[ChatMessage]:
+        """
+        Extract the text-only conversation from a specialist response.
+
+        ``full_conversation`` is the request this coordinator sent (already converted)
+        followed by the specialist's new messages. Only that new suffix can contain tool
+        content, so conversion work stays proportional to the new messages rather than
+        the whole history.
+
+        Parameters
+        ----------
+        response : AgentExecutorResponse
+            Specialist response carrying the full conversation snapshot
+
+        Returns
+        -------
+        list[ChatMessage]
+            Conversation with tool calls/results in the new messages converted to text
+        """
+        new_messages = list(response.agent_run_response.messages or [])
+        if response.full_conversation is None:
+            return convert_tool_content_to_text(new_messages)
+
+        prior_count = len(response.full_conversation) - len(new_messages)
+        return [*response.full_conversation[:prior_count], *convert_tool_content_to_text(new_messages)]
+
+    def _trim_conversation(self, conversation: list[ChatMessage]) -> list[ChatMessage]:
+        """
+        Bound the conversation using a head + recent window.
+
+        The window is limited by ``max_history_messages`` and/or ``max_history_tokens``.
+        The most recent message is always kept.
+
+        Parameters
+        ----------
+        conversation : list[ChatMessage]
+            Text-only conversation history
+
+        Returns
+        -------
+        list[ChatMessage]
+            The conversation unchanged if within bounds, otherwise the leading
+            messages, a marker noting how many messages were omitted, and the
+            most recent messages. A marker from an earlier trim is folded into the
+            new one, so its count covers every message omitted so far.
+        """
+        head = conversation[: self._keep_first_messages]
+        rest = conversation[self._keep_first_messages :]
+
+        # A marker left by an earlier trim is not an original message: drop it from the
+        # window and carry its count forward into the new marker.
+        prior_omitted = self._omitted_count(rest[0]) if rest else 0
+        if prior_omitted:
+            rest = rest[1:]
+        recent = rest
+
+        if self._max_history_messages is not None:
+            marker_slots = 1 if prior_omitted else 0
+            if len(head) + marker_slots + len(recent) > self._max_history_messages:
+                recent = recent[len(recent) - (self._max_history_messages - self._keep_first_messages - 1) :]
+
+        if self._max_history_tokens is not None:
+            budget = self._max_history_tokens - estimate_tokens(head)
+            costs = [estimate_tokens([message]) for message in recent]
+            if prior_omitted or len(recent) < len(rest) or sum(costs) > budget:
+                # The result will carry a marker: charge it against the budget, sized for
+                # the largest count it could report so the estimate stays an upper bound.
+                budget -= estimate_tokens([self._omission_marker(prior_omitted + len(rest))])
+            kept = 0
+            for cost in reversed(costs):
+                budget -= cost
+                if budget < 0 and kept:
+                    break
+                kept += 1
+            recent = recent[len(recent) - kept :]
+
+        newly_omitted = len(rest) - len(recent)
+        if newly_omitted == 0:
+            return conversation
+
+        return [*head, self._omission_marker(prior_omitted + newly_omitted), *recent]
+
+    @staticmethod
+    def _omission_marker(count: int) -> ChatMessage:
+        """Build the marker message that stands in for ``count`` omitted messages."""
+        return ChatMessage(Role.ASSISTANT, text=_OMITTED_MARKER_TEMPLATE.format(count=count))
+
+    @staticmethod
+    def _omitted_count(message: ChatMessage) -> int:
+        """Return the count recorded in an omission marker, or 0 if ``message`` is not a marker."""
+        if message.role != Role.ASSISTANT:
+            return 0
+        match = _OMITTED_MARKER_PATTERN.match(message.text or "")
+        return int(match.group(1)) if match else 0
+
     def _parse_specialist_output(self, response: AgentExecutorResponse) -> SpecialistOutput:
         """
         Parse SpecialistOutput from agent response.
@@ -391,8 +627,8 @@ class EventPlanningCoordinator(Executor):
         Route message to specialist agent with conversation history.
 
         Builds complete conversation by combining prior history with new routing message.
-        Converts tool calls and results to text summaries to avoid thread ID conflicts
-        when passing messages between agents with different service threads.
+        The prior history must already have tool calls and results converted to text
+        summaries to avoid thread ID conflicts between agents with different service threads.
 
         Parameters
         ----------
@@ -404,7 +640,8 @@ class EventPlanningCoordinator(Executor):
             Workflow context for sending messages
         prior_conversation : list[ChatMessage] | None, optional
             Previous conversation history to preserve. If None, starts fresh conversation.
-            Tool calls/results in prior conversation are converted to text summaries.
+            Tool calls/results must already be converted to text summaries
+            (see ``_extract_conversation``).
 
         Notes
         -----
@@ -412,8 +649,8 @@ class EventPlanningCoordinator(Executor):
         thread ID. Passing tool calls/results directly would cause Azure AI to reject the
         request with "No thread ID provided, but chat messages includes tool results."
         """
-        # Convert prior conversation to remove tool-specific content
-        conversation = convert_tool_content_to_text(prior_conversation) if prior_conversation else []
+        # Prior conversation is already text-only (converted once on receipt)
+        conversation = list(prior_conversation) if prior_conversation else []
 
         # Add new routing message
         conversation.append(ChatMessage(Role.USER, text=message))
@@ -10,26 +10,17 @@ import pytest
 from spec_to_agents.container import AppContainer
 
 
-@pytest.fixture(autouse=True)
-def setup_di_container():
+@pytest.fixture(scope="session")
+def _wired_container():
     """
-    Set up and wire DI container for all tests.
+    Create and wire the DI container once for the whole test session.
 
-    This fixture automatically runs before each test to ensure the DI container
-    is properly configured. It mocks out the client and global_tools providers
-    to avoid making real API calls during tests.
-
-    The fixture is autouse=True, so it runs automatically for all tests without
-    needing to be explicitly requested.
+    Wiring walks every module in the wired packages and patches their
+    ``@inject`` sites, so it is done once here rather than per test.
     """
     # Create container
     container = AppContainer()
 
-    # Override providers with mocks for testing
-    container.client.override(Mock())
-    container.global_tools.override({})
-    container.model_config.override({})
-
     # Wire the container to enable @inject decorators
     container.wire(
         packages=[
@@ -38,10 +29,52 @@ def setup_di_container():
         ]
     )
 
-    # Yield control to the test
     yield container
 
-    # Cleanup: unwire after test
+    # Cleanup: unwire at the end of the session
     with suppress(Exception):
         # Ignore unwiring errors during cleanup
         container.unwire()
+
+
+@pytest.fixture(autouse=True)
+def setup_di_container(_wired_container):
+    """
+    Set up DI container provider overrides for all tests.
+
+    This fixture automatically runs before each test to ensure the DI container
+    is properly configured. It mocks out the client and global_tools providers
+    to avoid making real API calls during tests, and resets every override
+    (including ones a test adds itself) afterwards.
+
+    The fixture is autouse=True, so it runs automatically for all tests without
+    needing to be explicitly requested.
+    """
+    container = _wired_container
+
+    # Override providers with mocks for testing
+    container.client.override(Mock())
+    container.global_tools.override({})
+    container.model_config.override({})
+
+    try:
+        # Yield control to the test
+        yield container
+    finally:
+        # Cleanup: drop overrides so the next test starts from a clean container
+        container.client.reset_override()
+        container.global_tools.reset_override()
+        container.model_config.reset_override()
+
+
+@pytest.fixture
+def mock_client(setup_di_container):
+    """
+    Provide a mocked agent client installed as the container's client.
+
+    ``create_agent`` returns a fresh ``Mock`` so agent factories can be exercised
+    without building real agents.
+    """
+    client = Mock(create_agent=Mock(return_value=Mock()))
+    setup_di_container.client.override(client)
+    return client
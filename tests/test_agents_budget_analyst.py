@@ -2,29 +2,18 @@
 
 """Tests for budget analyst agent factory."""
 
-from unittest.mock import Mock
-
 from agent_framework import HostedCodeInterpreterTool
 
 from spec_to_agents.agents.budget_analyst import create_agent
 
 
-def test_create_agent_without_request_user_input(setup_di_container):
+def test_create_agent_without_request_user_input(mock_client):
     """Test that budget analyst agent is created without request_user_input tool."""
-    # Arrange
-    container = setup_di_container
-    mock_client = Mock()
-    mock_agent = Mock()
-    mock_client.create_agent.return_value = mock_agent
-
-    # Override client provider with mock
-    container.client.override(mock_client)
-
     # Act
     agent = create_agent()
 
     # Assert
-    assert agent == mock_agent
+    assert agent == mock_client.create_agent.return_value
     mock_client.create_agent.assert_called_once()
     call_kwargs = mock_client.create_agent.call_args.kwargs
     # Verify that the first element in tools list is of type HostedCodeInterpreterTool
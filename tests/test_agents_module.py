@@ -2,34 +2,63 @@
 
 """Test that agents module exports workflow correctly."""
 
+import importlib
 
-def test_workflow_builder_accessible_from_workflow():
-    """Test that build_event_planning_workflow is accessible from workflow module."""
-    from spec_to_agents.workflow.core import build_event_planning_workflow
+import pytest
 
-    assert callable(build_event_planning_workflow)
+# (agent module, agent name, number of agent-specific tools, uses structured output)
+AGENT_FACTORY_CASES = [
+    ("event_coordinator", "event_coordinator", 0, False),
+    ("venue_specialist", "venue_specialist", 1, True),
+    ("budget_analyst", "budget_analyst", 1, True),
+    ("catering_coordinator", "catering_coordinator", 1, True),
+    ("logistics_manager", "logistics_manager", 4, True),
+]
 
 
-def test_export_workflow_accessible_from_workflow():
-    """Test that export_workflow is accessible from workflow module."""
-    from spec_to_agents.workflow import export_workflow
+@pytest.mark.parametrize(
+    ("module_name", "attribute"),
+    [
+        ("spec_to_agents.workflow.core", "build_event_planning_workflow"),
+        ("spec_to_agents.workflow", "export_workflow"),
+        ("spec_to_agents.agents", "export_agents"),
+    ],
+)
+def test_entry_points_accessible(module_name, attribute):
+    """Test that workflow and agent entry points are exposed by their modules."""
+    module = importlib.import_module(module_name)
 
-    assert callable(export_workflow)
+    assert callable(getattr(module, attribute))
 
 
-def test_workflow_builder_returns_workflow(setup_di_container):
+def test_workflow_builder_returns_workflow(mock_client):
     """Test that build_event_planning_workflow returns a Workflow instance."""
-    from unittest.mock import Mock
-
     from agent_framework import Workflow
 
     from spec_to_agents.workflow.core import build_event_planning_workflow
 
-    # Setup DI container with mocked client
-    container = setup_di_container
-    mock_client = Mock()
-    container.client.override(mock_client)
-
     workflow = build_event_planning_workflow()
     assert isinstance(workflow, Workflow)
     assert workflow.id == "event-planning-workflow"
+
+
+@pytest.mark.parametrize(("module_name", "agent_name", "tool_count", "has_response_format"), AGENT_FACTORY_CASES)
+def test_agent_factories_create_configured_agents(
+    mock_client, module_name, agent_name, tool_count, has_response_format
+):
+    """Test that each agent factory builds its agent through the injected client."""
+    from spec_to_agents.models.messages import SpecialistOutput
+
+    module = importlib.import_module(f"spec_to_agents.agents.{module_name}")
+
+    agent = module.create_agent()
+
+    assert agent == mock_client.create_agent.return_value
+    mock_client.create_agent.assert_called_once()
+    call_kwargs = mock_client.create_agent.call_args.kwargs
+    assert call_kwargs["name"] == agent_name
+    assert len(call_kwargs["tools"]) == tool_count
+    if has_response_format:
+        assert call_kwargs["response_format"] is SpecialistOutput
+    else:
+        assert "response_format" not in call_kwargs
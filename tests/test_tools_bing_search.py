@@ -2,266 +2,156 @@
 
 """Tests for Bing Search tool."""
 
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-
-@pytest.mark.asyncio
-@patch.dict(
-    "os.environ",
-    {
-        "BING_SUBSCRIPTION_KEY": "test_api_key",
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com",
-        "AZURE_OPENAI_API_KEY": "test_key",
-    },
-    clear=False,
+from spec_to_agents.tools import bing_search
+from spec_to_agents.tools.bing_search import web_search
+
+TEST_ENVIRONMENT = {
+    "BING_SUBSCRIPTION_KEY": "test_api_key",
+    "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com",
+    "AZURE_OPENAI_API_KEY": "test_key",
+}
+
+# Search agent responses used by the parametrized response test
+_RESP_SUCCESS = (
+    'Found 2 results for "Microsoft Agent Framework"\n\n'
+    "1. Microsoft Agent Framework\n"
+    "   Build intelligent multi-agent systems.\n"
+    "   URL: https://github.com/microsoft/agent-framework"
 )
-async def test_web_search_success():
-    """Test successful web search with results."""
-    from spec_to_agents.tools.bing_search import web_search
-
-    # Mock the agent's response
-    with (
-        patch("spec_to_agents.tools.bing_search.create_agent_client") as mock_client_factory,
-        patch("spec_to_agents.tools.bing_search.HostedWebSearchTool"),
-    ):
-        # Setup async context manager
-        mock_client = Mock()
-        mock_agent = Mock()
-        mock_response = Mock()
-        mock_response.text = 'Found 2 results for "Microsoft Agent Framework"\n\n1. Microsoft Agent Framework\n   Build intelligent multi-agent systems.\n   URL: https://github.com/microsoft/agent-framework'  # noqa: E501
-
-        mock_agent.run = AsyncMock(return_value=mock_response)
-        mock_client.create_agent.return_value = mock_agent
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client_factory.return_value = mock_client
-
-        result = await web_search("Microsoft Agent Framework")
-
-    assert 'Found 2 results for "Microsoft Agent Framework"' in result
-    assert "Microsoft Agent Framework" in result
-    assert "github.com/microsoft/agent-framework" in result
-
-
-@pytest.mark.asyncio
-@patch.dict(
-    "os.environ",
-    {
-        "BING_SUBSCRIPTION_KEY": "test_api_key",
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com",
-        "AZURE_OPENAI_API_KEY": "test_key",
-    },
-    clear=False,
+_RESP_FORMATTED = (
+    'Found 1 results for "test"\n\n'
+    "1. Test Result\n"
+    "   This is a test snippet.\n"
+    "   URL: https://example.com/test\n"
+    "   Source: example.com/test"
 )
-async def test_web_search_no_results():
-    """Test web search with no results."""
-    from spec_to_agents.tools.bing_search import web_search
-
-    with (
-        patch("spec_to_agents.tools.bing_search.create_agent_client") as mock_client_factory,
-        patch("spec_to_agents.tools.bing_search.HostedWebSearchTool"),
-    ):
-        mock_client = Mock()
-        mock_agent = Mock()
-        mock_response = Mock()
-        mock_response.text = "No results found for query: xyzabc123nonexistent"
-
-        mock_agent.run = AsyncMock(return_value=mock_response)
-        mock_client.create_agent.return_value = mock_agent
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client_factory.return_value = mock_client
-
-        result = await web_search("xyzabc123nonexistent")
-
-    assert "No results found" in result or "xyzabc123nonexistent" in result
-
-
-@pytest.mark.asyncio
-@patch.dict(
-    "os.environ",
-    {
-        "BING_SUBSCRIPTION_KEY": "test_api_key",
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com",
-        "AZURE_OPENAI_API_KEY": "test_key",
-    },
-    clear=False,
+_RESP_NUMBERING = (
+    'Found 2 results for "test"\n\n1. Result One\n   First result snippet.\n\n2. Result Two\n   Second result snippet.'
 )
-async def test_web_search_with_custom_count():
-    """Test web search creates agent with web search tool."""
-    from spec_to_agents.tools.bing_search import web_search
-
-    with (
-        patch("spec_to_agents.tools.bing_search.create_agent_client") as mock_client_factory,
-        patch("spec_to_agents.tools.bing_search.HostedWebSearchTool"),
-    ):
-        mock_client = Mock()
-        mock_agent = Mock()
-        mock_response = Mock()
-        mock_response.text = "Found 2 results"
-
-        mock_agent.run = AsyncMock(return_value=mock_response)
-        mock_client.create_agent.return_value = mock_agent
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client_factory.return_value = mock_client
 
-        result = await web_search("test query")
 
-    assert "Found 2 results" in result
-    # Verify agent was created with proper configuration
+@pytest.fixture(scope="module", autouse=True)
+def _web_search_environment():
+    """Set the search credentials once for every test in this module."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name, value in TEST_ENVIRONMENT.items():
+            monkeypatch.setenv(name, value)
+        yield
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _hosted_web_search_tool():
+    """Replace the hosted Bing tool once for every test in this module."""
+    with patch("spec_to_agents.tools.bing_search.HostedWebSearchTool") as mock_tool:
+        yield mock_tool
+
+
+@pytest.fixture
+def mock_client_factory(monkeypatch):
+    """Replace the agent client factory used by ``web_search``."""
+    factory = Mock()
+    monkeypatch.setattr(bing_search, "create_agent_client", factory)
+    return factory
+
+
+def _mock_client(response_text=None, enter_side_effect=None):
+    """
+    Build a mocked agent client usable as an async context manager.
+
+    Parameters
+    ----------
+    response_text : str | None
+        Text returned by the temporary search agent's ``run``
+    enter_side_effect : Exception | None
+        Exception raised when entering the client context, if any
+
+    Returns
+    -------
+    MagicMock
+        Client whose ``create_agent`` returns an agent with an async ``run``
+    """
+    # MagicMock provides async __aenter__/__aexit__ support out of the box
+    mock_client = MagicMock()
+    mock_agent = Mock()
+    # web_search only reads the response text
+    mock_agent.run = AsyncMock(return_value=SimpleNamespace(text=response_text))
+    mock_client.create_agent.return_value = mock_agent
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.__aenter__.side_effect = enter_side_effect
+    return mock_client
+
+
+@pytest.mark.parametrize(
+    ("query", "response_text", "expected", "unexpected"),
+    [
+        pytest.param(
+            "Microsoft Agent Framework",
+            _RESP_SUCCESS,
+            [
+                'Found 2 results for "Microsoft Agent Framework"',
+                "Microsoft Agent Framework",
+                "github.com/microsoft/agent-framework",
+            ],
+            [],
+            id="success",
+        ),
+        pytest.param(
+            "xyzabc123nonexistent",
+            "No results found for query: xyzabc123nonexistent",
+            ["No results found", "xyzabc123nonexistent"],
+            [],
+            id="no_results",
+        ),
+        pytest.param(
+            "test",
+            _RESP_FORMATTED,
+            ['Found 1 results for "test"', "1. Test Result", "This is a test snippet.", "https://example.com/test"],
+            [],
+            id="formatting",
+        ),
+        pytest.param(
+            "empty query",
+            "No results found for query: empty query",
+            ["No results found", "empty query"],
+            [],
+            id="empty_results_list",
+        ),
+        pytest.param(
+            "test",
+            _RESP_NUMBERING,
+            ["1. ", "2. "],
+            # Should not have 0. or 3. since we have 2 results
+            ["0. ", "3. "],
+            id="result_numbering",
+        ),
+    ],
+)
+async def test_web_search_returns_agent_response(mock_client_factory, query, response_text, expected, unexpected):
+    """Test web search returns the search agent's formatted response text."""
+    mock_client = _mock_client(response_text)
+    mock_client_factory.return_value = mock_client
+
+    result = await web_search(query)
+
+    for substring in expected:
+        assert substring in result
+    for substring in unexpected:
+        assert substring not in result
+    # Verify a single temporary agent was created for the search
     mock_client.create_agent.assert_called_once()
 
 
-@pytest.mark.asyncio
-@patch.dict(
-    "os.environ",
-    {
-        "BING_SUBSCRIPTION_KEY": "test_api_key",
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com",
-        "AZURE_OPENAI_API_KEY": "test_key",
-    },
-    clear=False,
-)
-async def test_web_search_api_error():
+async def test_web_search_api_error(mock_client_factory):
     """Test web search handles API errors gracefully."""
-    from spec_to_agents.tools.bing_search import web_search
-
-    with (
-        patch("spec_to_agents.tools.bing_search.create_agent_client") as mock_client_factory,
-        patch("spec_to_agents.tools.bing_search.HostedWebSearchTool"),
-    ):
-        mock_client = Mock()
-        mock_client.__aenter__ = AsyncMock(side_effect=Exception("API rate limit exceeded"))
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client_factory.return_value = mock_client
+    mock_client_factory.return_value = _mock_client(enter_side_effect=Exception("API rate limit exceeded"))
 
-        result = await web_search("test query")
+    result = await web_search("test query")
 
     assert "Error performing web search" in result
     assert "Exception" in result
     assert "API rate limit exceeded" in result
-
-
-@pytest.mark.asyncio
-@patch.dict(
-    "os.environ",
-    {
-        "BING_SUBSCRIPTION_KEY": "test_api_key",
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com",
-        "AZURE_OPENAI_API_KEY": "test_key",
-    },
-    clear=False,
-)
-async def test_web_search_formatting():
-    """Test that results are properly formatted for LM consumption."""
-    from spec_to_agents.tools.bing_search import web_search
-
-    with (
-        patch("spec_to_agents.tools.bing_search.create_agent_client") as mock_client_factory,
-        patch("spec_to_agents.tools.bing_search.HostedWebSearchTool"),
-    ):
-        mock_client = Mock()
-        mock_agent = Mock()
-        mock_response = Mock()
-        mock_response.text = (
-            'Found 1 results for "test"\n\n'
-            "1. Test Result\n"
-            "   This is a test snippet.\n"
-            "   URL: https://example.com/test\n"
-            "   Source: example.com/test"
-        )
-
-        mock_agent.run = AsyncMock(return_value=mock_response)
-        mock_client.create_agent.return_value = mock_agent
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client_factory.return_value = mock_client
-
-        result = await web_search("test")
-
-    # Check formatting structure
-    assert 'Found 1 results for "test"' in result
-    assert "1. Test Result" in result
-    assert "This is a test snippet." in result
-    assert "https://example.com/test" in result
-
-
-@pytest.mark.asyncio
-@patch.dict(
-    "os.environ",
-    {
-        "BING_SUBSCRIPTION_KEY": "test_api_key",
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com",
-        "AZURE_OPENAI_API_KEY": "test_key",
-    },
-    clear=False,
-)
-async def test_web_search_empty_results_list():
-    """Test web search when results list is empty."""
-    from spec_to_agents.tools.bing_search import web_search
-
-    with (
-        patch("spec_to_agents.tools.bing_search.create_agent_client") as mock_client_factory,
-        patch("spec_to_agents.tools.bing_search.HostedWebSearchTool"),
-    ):
-        mock_client = Mock()
-        mock_agent = Mock()
-        mock_response = Mock()
-        mock_response.text = "No results found for query: empty query"
-
-        mock_agent.run = AsyncMock(return_value=mock_response)
-        mock_client.create_agent.return_value = mock_agent
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client_factory.return_value = mock_client
-
-        result = await web_search("empty query")
-
-    assert "No results found" in result or "empty query" in result
-
-
-@pytest.mark.asyncio
-@patch.dict(
-    "os.environ",
-    {
-        "BING_SUBSCRIPTION_KEY": "test_api_key",
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com",
-        "AZURE_OPENAI_API_KEY": "test_key",
-    },
-    clear=False,
-)
-async def test_web_search_result_numbering():
-    """Test that results are properly numbered starting from 1."""
-    from spec_to_agents.tools.bing_search import web_search
-
-    with (
-        patch("spec_to_agents.tools.bing_search.create_agent_client") as mock_client_factory,
-        patch("spec_to_agents.tools.bing_search.HostedWebSearchTool"),
-    ):
-        mock_client = Mock()
-        mock_agent = Mock()
-        mock_response = Mock()
-        mock_response.text = (
-            'Found 2 results for "test"\n\n'
-            "1. Result One\n"
-            "   First result snippet.\n\n"
-            "2. Result Two\n"
-            "   Second result snippet."
-        )
-
-        mock_agent.run = AsyncMock(return_value=mock_response)
-        mock_client.create_agent.return_value = mock_agent
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client_factory.return_value = mock_client
-
-        result = await web_search("test")
-
-    assert "1. " in result
-    assert "2. " in result
-    # Should not have 0. or 3. since we have 2 results
-    assert "0. " not in result
-    assert "3. " not in result
@@ -12,13 +12,8 @@ def temp_calendar_path(tmp_path, monkeypatch):
     """Create temporary calendar directory."""
     calendar_dir = tmp_path / "calendars"
     calendar_dir.mkdir()
+    # The calendar tools read the storage path on each call, so no module reload is needed
     monkeypatch.setenv("CALENDAR_STORAGE_PATH", str(calendar_dir))
-    # Re-import the module to pick up the new environment variable
-    import importlib
-
-    import spec_to_agents.tools.calendar
-
-    importlib.reload(spec_to_agents.tools.calendar)
     return calendar_dir
 
 
@@ -163,3 +158,15 @@ async def test_multiple_events_same_calendar(temp_calendar_path):
     assert "Morning Meeting" in result
     assert "Lunch" in result
     assert "Afternoon Workshop" in result
+
+
+@pytest.mark.asyncio
+async def test_create_calendar_event_creates_storage_directory(tmp_path, monkeypatch):
+    """Test creating an event creates a missing storage directory from the current environment."""
+    calendar_dir = tmp_path / "nested" / "calendars"
+    monkeypatch.setenv("CALENDAR_STORAGE_PATH", str(calendar_dir))
+
+    result = await create_calendar_event(event_title="Kickoff", start_date="2025-12-01", start_time="09:00")
+
+    assert "Successfully created event 'Kickoff'" in result
+    assert (calendar_dir / "event_planning.ics").exists()
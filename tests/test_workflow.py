@@ -93,3 +93,18 @@ def test_coordinator_uses_service_managed_threads(setup_di_container) -> None:
     # Should NOT have obsolete attributes
     assert not hasattr(coordinator, "_current_index"), "Coordinator should not have _current_index"
     assert not hasattr(coordinator, "_specialist_sequence"), "Coordinator should not have _specialist_sequence"
+
+
+def test_workflow_reads_history_bounds_from_environment(setup_di_container, monkeypatch) -> None:
+    """Test that conversation history bounds are configurable through the environment."""
+    container = setup_di_container
+    client = create_agent_client_for_devui()
+    container.client.override(client)
+    monkeypatch.setenv("MAX_HISTORY_MESSAGES", "40")
+    monkeypatch.setenv("MAX_HISTORY_TOKENS", "60000")
+
+    test_workflow = build_event_planning_workflow()
+
+    coordinator = test_workflow.executors["event_coordinator"]
+    assert coordinator._max_history_messages == 40
+    assert coordinator._max_history_tokens == 60000
@@ -194,6 +194,40 @@ async def test_on_specialist_response_routes_to_next_agent():
     assert call_args[1]["target_id"] == "budget"
 
 
+@pytest.mark.asyncio
+async def test_on_specialist_response_converts_only_new_messages():
+    """Test that only the specialist's new messages are converted; the prior request is reused."""
+    from spec_to_agents.models.messages import SpecialistOutput
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    prior_message = ChatMessage(Role.USER, text="Find venues")
+    new_message = ChatMessage(
+        Role.ASSISTANT,
+        contents=[FunctionCallContent(name="web_search", arguments={"query": "venues"}, call_id="call_1")],
+    )
+
+    mock_response = Mock()
+    mock_response.executor_id = "venue"
+    mock_response.agent_run_response.value = SpecialistOutput(
+        summary="Researched venues", next_agent="budget", user_input_needed=False, user_prompt=None
+    )
+    mock_response.full_conversation = [prior_message, new_message]
+    mock_response.agent_run_response.messages = [new_message]
+
+    coordinator = EventPlanningCoordinator(Mock())
+    mock_ctx = AsyncMock()
+
+    await coordinator.on_specialist_response(mock_response, mock_ctx)
+
+    request = mock_ctx.send_message.call_args[0][0]
+    # Prior message is passed through untouched, new tool call is converted to text
+    assert request.messages[0] is prior_message
+    assert isinstance(request.messages[1].contents[0], TextContent)
+    assert "Tool Call: web_search" in request.messages[1].text
+    # Routing message appended last
+    assert len(request.messages) == 3
+
+
 @pytest.mark.asyncio
 async def test_on_specialist_response_requests_user_input():
     """Test requesting user input when specialist needs it."""
@@ -332,6 +366,31 @@ async def test_synthesize_plan_uses_framework_context():
     mock_ctx.yield_output.assert_called_once_with("Complete event plan with all specialist recommendations.")
 
 
+@pytest.mark.asyncio
+async def test_synthesize_plan_appends_instruction_after_unchanged_prefix():
+    """Test synthesis keeps the conversation prefix intact and appends a fixed instruction."""
+    from agent_framework import ChatMessage, Role
+
+    from spec_to_agents.workflow.executors import _SYNTHESIS_PROMPT, EventPlanningCoordinator
+
+    coordinator = EventPlanningCoordinator(Mock())
+    coordinator._agent = AsyncMock()
+    coordinator._agent.run = AsyncMock(return_value=Mock(text="Plan"))
+
+    conversation = [
+        ChatMessage(Role.USER, text="Plan event"),
+        ChatMessage(Role.ASSISTANT, text="Venue specialist work done"),
+    ]
+
+    await coordinator._synthesize_plan(AsyncMock(), conversation)
+
+    messages = coordinator._agent.run.call_args[1]["messages"]
+    assert messages[:-1] == conversation
+    assert all(sent is original for sent, original in zip(messages, conversation, strict=False))
+    assert messages[-1].role == Role.USER
+    assert messages[-1].text == _SYNTHESIS_PROMPT
+
+
 def test_convert_tool_content_to_text_function_calls():
     """Test converting function calls to text summaries."""
     messages = [
@@ -357,6 +416,57 @@ def test_convert_tool_content_to_text_function_calls():
     assert "event venues" in converted[0].contents[1].text
 
 
+def test_convert_tool_content_to_text_serializes_compact_json():
+    """Test that dict arguments and results are rendered as compact JSON."""
+    messages = [
+        ChatMessage(
+            Role.ASSISTANT,
+            contents=[
+                FunctionCallContent(name="get_weather", arguments={"city": "Seattle", "days": 3}, call_id="call_1"),
+                FunctionResultContent(call_id="call_1", result={"forecast": ["rain", "sun"]}, name="get_weather"),
+            ],
+        )
+    ]
+
+    converted = convert_tool_content_to_text(messages)
+
+    assert converted[0].contents[0].text == '[Tool Call: get_weather({"city":"Seattle","days":3})]'
+    assert converted[0].contents[1].text == '[Tool Result for call call_1: {"forecast":["rain","sun"]}]'
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_convert_tool_content_to_text_compact_json_per_backend(backend, monkeypatch):
+    """Test that both serializer backends render identical compact JSON."""
+    from spec_to_agents.workflow import executors
+
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(executors, "_dumps", executors._json_dumps)
+    messages = [
+        ChatMessage(
+            Role.ASSISTANT,
+            contents=[
+                FunctionCallContent(name="get_weather", arguments={"city": "Zürich", "days": 3}, call_id="call_1"),
+                FunctionResultContent(call_id="call_1", result={"forecast": ["rain", "sun"]}, name="get_weather"),
+            ],
+        )
+    ]
+
+    converted = convert_tool_content_to_text(messages)
+
+    assert converted[0].contents[0].text == '[Tool Call: get_weather({"city":"Zürich","days":3})]'
+    assert converted[0].contents[1].text == '[Tool Result for call call_1: {"forecast":["rain","sun"]}]'
+
+
+def test_dumps_falls_back_to_json_for_values_orjson_rejects():
+    """Test that integers beyond 64 bits are serialized instead of aborting the turn."""
+    pytest.importorskip("orjson")
+    from spec_to_agents.workflow.executors import _dumps
+
+    assert _dumps({"n": 2**70}) == '{"n":1180591620717411303424}'
+
+
 def test_convert_tool_content_to_text_function_results():
     """Test converting function results to text summaries."""
     messages = [
@@ -395,6 +505,39 @@ def test_convert_tool_content_to_text_preserves_role_and_metadata():
     assert converted[0].message_id == "msg_789"
 
 
+def test_convert_tool_content_to_text_handles_tool_content_subclasses():
+    """Test that subclasses of the SDK tool content types are still converted."""
+
+    class CustomCallContent(FunctionCallContent):
+        pass
+
+    messages = [
+        ChatMessage(
+            Role.ASSISTANT,
+            contents=[CustomCallContent(name="web_search", arguments={"q": "venues"}, call_id="call_1")],
+        )
+    ]
+
+    converted = convert_tool_content_to_text(messages)
+
+    assert isinstance(converted[0].contents[0], TextContent)
+    assert "Tool Call: web_search" in converted[0].contents[0].text
+
+
+def test_convert_tool_content_to_text_reuses_text_only_messages():
+    """Test that messages without tool content are passed through without copying."""
+    text_message = ChatMessage(Role.ASSISTANT, contents=[TextContent(text="Found results!")])
+    tool_message = ChatMessage(
+        Role.TOOL,
+        contents=[FunctionResultContent(call_id="call_1", result="Result data", name="web_search")],
+    )
+
+    converted = convert_tool_content_to_text([text_message, tool_message])
+
+    assert converted[0] is text_message
+    assert converted[1] is not tool_message
+
+
 def test_convert_tool_content_to_text_handles_mixed_content():
     """Test converting messages with mixed text and tool content."""
     messages = [
@@ -430,3 +573,157 @@ def test_convert_tool_content_to_text_handles_mixed_content():
     assert len(converted[2].contents) == 1
     assert isinstance(converted[2].contents[0], TextContent)
     assert converted[2].contents[0].text == "Found results!"
+
+
+def test_trim_conversation_keeps_full_history_by_default():
+    """Test that conversation is forwarded unchanged when no bound is configured."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    coordinator = EventPlanningCoordinator(Mock())
+    conversation = [ChatMessage(Role.USER, text=f"message {i}") for i in range(50)]
+
+    assert coordinator._trim_conversation(conversation) is conversation
+
+
+def test_trim_conversation_keeps_head_and_recent_messages():
+    """Test that an oversized conversation keeps leading and most recent messages."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    coordinator = EventPlanningCoordinator(Mock(), max_history_messages=6, keep_first_messages=2)
+    conversation = [ChatMessage(Role.USER, text=f"message {i}") for i in range(10)]
+
+    trimmed = coordinator._trim_conversation(conversation)
+
+    assert len(trimmed) == 6
+    assert [m.text for m in trimmed[:2]] == ["message 0", "message 1"]
+    assert "5 earlier messages omitted" in trimmed[2].text
+    assert [m.text for m in trimmed[3:]] == ["message 7", "message 8", "message 9"]
+
+
+def test_trim_conversation_carries_omitted_count_across_hops():
+    """Test that re-trimming a trimmed conversation counts all omitted originals."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    coordinator = EventPlanningCoordinator(Mock(), max_history_messages=6, keep_first_messages=2)
+    conversation = [ChatMessage(Role.USER, text=f"message {i}") for i in range(10)]
+
+    first_hop = coordinator._trim_conversation(conversation)
+    next_conversation = [*first_hop, *(ChatMessage(Role.USER, text=f"message {i}") for i in range(10, 13))]
+    second_hop = coordinator._trim_conversation(next_conversation)
+
+    assert len(second_hop) == 6
+    assert [m.text for m in second_hop[:2]] == ["message 0", "message 1"]
+    # messages 2-9 are gone: 5 from the first hop plus 3 from the second
+    assert "8 earlier messages omitted" in second_hop[2].text
+    assert [m.text for m in second_hop[3:]] == ["message 10", "message 11", "message 12"]
+
+
+def test_trim_conversation_keeps_earlier_marker_when_within_bounds():
+    """Test that a trimmed conversation still within bounds is forwarded unchanged."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    coordinator = EventPlanningCoordinator(Mock(), max_history_messages=6, keep_first_messages=2)
+    conversation = coordinator._trim_conversation([ChatMessage(Role.USER, text=f"message {i}") for i in range(10)])
+
+    assert coordinator._trim_conversation(conversation) is conversation
+
+
+def test_coordinator_rejects_negative_keep_first_messages():
+    """Test that the number of leading messages to keep cannot be negative."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    with pytest.raises(ValueError, match="keep_first_messages"):
+        EventPlanningCoordinator(Mock(), keep_first_messages=-1)
+
+
+def test_coordinator_rejects_too_small_history_bound():
+    """Test that the history bound must leave room for head, marker and recent messages."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    with pytest.raises(ValueError, match="max_history_messages"):
+        EventPlanningCoordinator(Mock(), max_history_messages=3, keep_first_messages=2)
+
+
+def test_estimate_tokens_uses_character_ratio():
+    """Test that token estimate rounds up characters divided by the ratio."""
+    from spec_to_agents.workflow.executors import estimate_tokens
+
+    assert estimate_tokens([]) == 0
+    assert estimate_tokens([ChatMessage(Role.USER, text="abcde")]) == 2
+    assert estimate_tokens([ChatMessage(Role.USER, text="abcd"), ChatMessage(Role.USER, text="abcd")]) == 2
+
+
+def test_trim_conversation_by_token_budget():
+    """Test that oversized tool results are trimmed by token budget even with few messages."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    coordinator = EventPlanningCoordinator(Mock(), max_history_tokens=100, keep_first_messages=1)
+    conversation = [
+        ChatMessage(Role.USER, text="Plan a party"),
+        ChatMessage(Role.ASSISTANT, text="x" * 400),
+        ChatMessage(Role.ASSISTANT, text="y" * 200),
+        ChatMessage(Role.ASSISTANT, text="Latest summary"),
+    ]
+
+    trimmed = coordinator._trim_conversation(conversation)
+
+    assert trimmed[0].text == "Plan a party"
+    assert "1 earlier messages omitted" in trimmed[1].text
+    assert [m.text for m in trimmed[2:]] == ["y" * 200, "Latest summary"]
+
+
+def _token_budget_conversation():
+    """Build a head message followed by eight specialist notes of about 15 tokens each."""
+    return [ChatMessage(Role.USER, text="Plan a party")] + [
+        ChatMessage(Role.ASSISTANT, text=f"specialist note {i} " + "z" * 40) for i in range(8)
+    ]
+
+
+@pytest.mark.parametrize("max_history_tokens", [45, 60, 80, 120, 200])
+def test_trim_conversation_result_fits_token_budget(max_history_tokens):
+    """Test that the trimmed conversation, marker included, stays within the token budget."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator, estimate_tokens
+
+    coordinator = EventPlanningCoordinator(Mock(), max_history_tokens=max_history_tokens, keep_first_messages=1)
+    conversation = _token_budget_conversation()
+
+    trimmed = coordinator._trim_conversation(conversation)
+
+    assert trimmed[-1] is conversation[-1]
+    assert estimate_tokens(trimmed) <= max_history_tokens
+
+
+@pytest.mark.parametrize("max_history_tokens", [20, 30])
+def test_trim_conversation_keeps_latest_message_over_token_budget(max_history_tokens):
+    """Test that the latest message is kept even when it does not fit the token budget."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator, estimate_tokens
+
+    coordinator = EventPlanningCoordinator(Mock(), max_history_tokens=max_history_tokens, keep_first_messages=1)
+    conversation = _token_budget_conversation()
+
+    trimmed = coordinator._trim_conversation(conversation)
+
+    assert len(trimmed) == 3
+    assert trimmed[0] is conversation[0]
+    assert trimmed[1].text.startswith("[7 earlier messages omitted")
+    assert trimmed[2] is conversation[-1]
+    assert estimate_tokens(trimmed) > max_history_tokens
+
+
+@pytest.mark.parametrize("max_history_tokens", [0, -10])
+def test_coordinator_rejects_non_positive_token_budget(max_history_tokens):
+    """Test that the token budget must be positive."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    with pytest.raises(ValueError, match="max_history_tokens"):
+        EventPlanningCoordinator(Mock(), max_history_tokens=max_history_tokens)
+
+
+def test_trim_conversation_within_token_budget_is_unchanged():
+    """Test that a conversation within the token budget is returned as-is."""
+    from spec_to_agents.workflow.executors import EventPlanningCoordinator
+
+    coordinator = EventPlanningCoordinator(Mock(), max_history_tokens=1000)
+    conversation = [ChatMessage(Role.USER, text="Plan a party"), ChatMessage(Role.ASSISTANT, text="Done")]
+
+    assert coordinator._trim_conversation(conversation) is conversation
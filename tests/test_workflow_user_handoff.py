@@ -2,20 +2,14 @@
 
 """Tests for human-in-the-loop workflow functionality."""
 
-from unittest.mock import Mock
-
 import pytest
 from agent_framework import RequestInfoEvent
 
 from spec_to_agents.workflow.core import build_event_planning_workflow
 
 
-def test_workflow_builds_with_hitl_components(setup_di_container):
+def test_workflow_builds_with_hitl_components(mock_client):
     """Test that workflow builds successfully with HITL components."""
-    container = setup_di_container
-    mock_client = Mock()
-    container.client.override(mock_client)
-
     workflow = build_event_planning_workflow()
     assert workflow is not None
 